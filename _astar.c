@@ -0,0 +1,209 @@
+/*
+ * A* pathfinding kernel as a hand-written C extension.
+ *
+ * Same flat-array design as pathfinder_numba.py: cells linearized to
+ * idx = x * cols + y, int32 g-scores and predecessors, and a manual
+ * binary min-heap of (f, idx) pairs with lazy deletion. Unlike the
+ * Numba kernel there is no JIT warm-up cost and no multi-second
+ * import, so this is the preferred fast path when it is built.
+ *
+ * astar(grid, sx, sy, gx, gy) -> int32 array of (x, y) path rows,
+ * empty (0, 2) array if the goal is unreachable. grid must be a 2D
+ * int8 array with 0 = free, 1 = obstacle.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#include <numpy/arrayobject.h>
+
+#include <stdlib.h>
+
+#define G_UNSET INT32_MAX
+
+static void
+sift_up(int32_t *heap_f, int32_t *heap_idx, npy_intp pos)
+{
+    int32_t item_f = heap_f[pos];
+    int32_t item_idx = heap_idx[pos];
+    while (pos > 0) {
+        npy_intp parent = (pos - 1) >> 1;
+        if (heap_f[parent] <= item_f)
+            break;
+        heap_f[pos] = heap_f[parent];
+        heap_idx[pos] = heap_idx[parent];
+        pos = parent;
+    }
+    heap_f[pos] = item_f;
+    heap_idx[pos] = item_idx;
+}
+
+static void
+sift_down(int32_t *heap_f, int32_t *heap_idx, npy_intp size)
+{
+    npy_intp pos = 0, child = 1;
+    int32_t item_f = heap_f[0];
+    int32_t item_idx = heap_idx[0];
+    while (child < size) {
+        if (child + 1 < size && heap_f[child + 1] < heap_f[child])
+            child++;
+        if (heap_f[child] >= item_f)
+            break;
+        heap_f[pos] = heap_f[child];
+        heap_idx[pos] = heap_idx[child];
+        pos = child;
+        child = (pos << 1) + 1;
+    }
+    heap_f[pos] = item_f;
+    heap_idx[pos] = item_idx;
+}
+
+static PyObject *
+astar(PyObject *self, PyObject *args)
+{
+    PyArrayObject *grid_obj;
+    int sx, sy, gx, gy;
+
+    if (!PyArg_ParseTuple(args, "O!iiii", &PyArray_Type, &grid_obj,
+                          &sx, &sy, &gx, &gy))
+        return NULL;
+
+    if (PyArray_NDIM(grid_obj) != 2 || PyArray_TYPE(grid_obj) != NPY_INT8) {
+        PyErr_SetString(PyExc_ValueError, "grid must be a 2D int8 array");
+        return NULL;
+    }
+
+    PyArrayObject *grid =
+        (PyArrayObject *)PyArray_GETCONTIGUOUS(grid_obj);
+    if (grid == NULL)
+        return NULL;
+
+    const signed char *cells = (const signed char *)PyArray_DATA(grid);
+    npy_intp rows = PyArray_DIM(grid, 0);
+    npy_intp cols = PyArray_DIM(grid, 1);
+    npy_intp n = rows * cols;
+
+    if (sx < 0 || sx >= rows || sy < 0 || sy >= cols ||
+        gx < 0 || gx >= rows || gy < 0 || gy >= cols) {
+        Py_DECREF(grid);
+        PyErr_SetString(PyExc_ValueError, "start/goal outside the grid");
+        return NULL;
+    }
+
+    int32_t *g = malloc(n * sizeof(int32_t));
+    int32_t *came_from = malloc(n * sizeof(int32_t));
+    /* Each of the 4 edges per cell can push at most once */
+    int32_t *heap_f = malloc((4 * n + 1) * sizeof(int32_t));
+    int32_t *heap_idx = malloc((4 * n + 1) * sizeof(int32_t));
+
+    if (g == NULL || came_from == NULL || heap_f == NULL || heap_idx == NULL) {
+        free(g); free(came_from); free(heap_f); free(heap_idx);
+        Py_DECREF(grid);
+        return PyErr_NoMemory();
+    }
+
+    for (npy_intp i = 0; i < n; i++) {
+        g[i] = G_UNSET;
+        came_from[i] = -1;
+    }
+
+    int32_t start_idx = (int32_t)(sx * cols + sy);
+    int32_t goal_idx = (int32_t)(gx * cols + gy);
+    npy_intp heap_size = 1;
+    int found = 0;
+
+    g[start_idx] = 0;
+    heap_f[0] = abs(sx - gx) + abs(sy - gy);
+    heap_idx[0] = start_idx;
+
+    while (heap_size > 0) {
+        int32_t cur_f = heap_f[0];
+        int32_t cur_idx = heap_idx[0];
+        heap_size--;
+        if (heap_size > 0) {
+            heap_f[0] = heap_f[heap_size];
+            heap_idx[0] = heap_idx[heap_size];
+            sift_down(heap_f, heap_idx, heap_size);
+        }
+
+        int32_t x = cur_idx / (int32_t)cols;
+        int32_t y = cur_idx % (int32_t)cols;
+
+        /* Lazy deletion: skip entries superseded by a better push */
+        if (cur_f > g[cur_idx] + abs(x - gx) + abs(y - gy))
+            continue;
+
+        if (cur_idx == goal_idx) {
+            found = 1;
+            break;
+        }
+
+        int32_t tentative_g = g[cur_idx] + 1;
+
+        for (int d = 0; d < 4; d++) {
+            static const int dx[4] = {-1, 1, 0, 0};
+            static const int dy[4] = {0, 0, -1, 1};
+            int32_t nx = x + dx[d];
+            int32_t ny = y + dy[d];
+
+            if (nx < 0 || nx >= rows || ny < 0 || ny >= cols)
+                continue;
+            int32_t nidx = nx * (int32_t)cols + ny;
+            if (cells[nidx] != 0)
+                continue;
+
+            if (tentative_g < g[nidx]) {
+                g[nidx] = tentative_g;
+                came_from[nidx] = cur_idx;
+                heap_f[heap_size] = tentative_g + abs(nx - gx) + abs(ny - gy);
+                heap_idx[heap_size] = nidx;
+                heap_size++;
+                sift_up(heap_f, heap_idx, heap_size - 1);
+            }
+        }
+    }
+
+    /* Path length is known from the goal's g-score; fill backward */
+    npy_intp length = found ? (npy_intp)g[goal_idx] + 1 : 0;
+    npy_intp dims[2] = {length, 2};
+    PyArrayObject *path =
+        (PyArrayObject *)PyArray_SimpleNew(2, dims, NPY_INT32);
+    if (path != NULL && found) {
+        int32_t *out = (int32_t *)PyArray_DATA(path);
+        int32_t idx = goal_idx;
+        for (npy_intp i = length - 1; i >= 0; i--) {
+            out[2 * i] = idx / (int32_t)cols;
+            out[2 * i + 1] = idx % (int32_t)cols;
+            idx = came_from[idx];
+        }
+    }
+
+    free(g);
+    free(came_from);
+    free(heap_f);
+    free(heap_idx);
+    Py_DECREF(grid);
+    return (PyObject *)path;
+}
+
+static PyMethodDef astar_methods[] = {
+    {"astar", astar, METH_VARARGS,
+     "astar(grid, sx, sy, gx, gy) -> int32 array of (x, y) path rows"},
+    {NULL, NULL, 0, NULL}
+};
+
+static struct PyModuleDef astar_module = {
+    PyModuleDef_HEAD_INIT,
+    "_astar",
+    "C implementation of the A* grid-search kernel",
+    -1,
+    astar_methods
+};
+
+PyMODINIT_FUNC
+PyInit__astar(void)
+{
+    import_array();
+    return PyModule_Create(&astar_module);
+}
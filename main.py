@@ -1,3 +1,5 @@
+import numpy as np
+
 from warehouse import WarehouseGrid
 from pathfinder import AStarPathfinder
 from visualizer import WarehouseVisualizer
@@ -13,28 +15,33 @@ def get_user_input(warehouse):
     - start: Tuple (x, y)
     - goal: Tuple (x, y)
     """
+    # Hoist once: avoids re-resolving warehouse attributes through the
+    # closure on every validation retry
+    size = warehouse.size
+    grid = warehouse.grid
+
     print("\n" + "="*70)
     print("  📍 COORDINATE INPUT")
     print("="*70)
-    print(f"Grid size: {warehouse.size}x{warehouse.size}")
-    print(f"Valid coordinates: 0 to {warehouse.size - 1}")
+    print(f"Grid size: {size}x{size}")
+    print(f"Valid coordinates: 0 to {size - 1}")
     print("Example: Enter '0 0' for top-left corner")
     print("="*70 + "\n")
-    
+
     def get_coordinates(prompt):
         """Helper function to get and validate single coordinate pair"""
         while True:
             try:
                 user_input = input(prompt)
                 x, y = map(int, user_input.strip().split())
-                
+
                 # Validate bounds
-                if not (0 <= x < warehouse.size and 0 <= y < warehouse.size):
-                    print(f"❌ Error: Coordinates must be between 0 and {warehouse.size - 1}")
+                if not (0 <= x < size and 0 <= y < size):
+                    print(f"❌ Error: Coordinates must be between 0 and {size - 1}")
                     continue
-                
+
                 # Check if position is obstacle
-                if warehouse.grid[x, y] == 1:
+                if grid[x, y] == 1:
                     print(f"⚠️  Warning: Position ({x}, {y}) has an obstacle!")
                     clear = input("   Clear this position? (y/n): ").lower()
                     if clear == 'y':
@@ -80,7 +87,7 @@ def print_results(path, start, goal):
     print("  📊 NAVIGATION RESULTS")
     print("="*70)
     
-    if not path:
+    if len(path) == 0:
         print("❌ NO PATH FOUND!")
         print("   The robot cannot reach the exit due to obstacles.")
         print("   Try different coordinates or reduce obstacle density.")
@@ -99,12 +106,11 @@ def print_results(path, start, goal):
         print("\n   🎉 ITEM DELIVERED SUCCESSFULLY!")
         
         # Show first few and last few steps
-        if len(path) <= 10:
-            print(f"\n   Complete path: {' → '.join([str(p) for p in path])}")
+        steps = [str(tuple(p)) for p in np.asarray(path).tolist()]
+        if len(steps) <= 10:
+            print(f"\n   Complete path: {' → '.join(steps)}")
         else:
-            first_steps = ' → '.join([str(p) for p in path[:3]])
-            last_steps = ' → '.join([str(p) for p in path[-3:]])
-            print(f"\n   Path: {first_steps} → ... → {last_steps}")
+            print(f"\n   Path: {' → '.join(steps[:3])} → ... → {' → '.join(steps[-3:])}")
     
     print("="*70 + "\n")
 
@@ -147,40 +153,44 @@ def main():
     pathfinder = AStarPathfinder(warehouse)
     path = pathfinder.find_path(start, goal)
     
-    if path:
+    if len(path):
         print(f"✓ Path computed! ({len(path)} steps)")
     else:
-        if not path:
-            print("❌ No valid path found between Start and Exit!")
-            print("🤖 Trying nearby alternate exits...")
+        print("❌ No valid path found between Start and Exit!")
+        print("🤖 Trying nearby alternate exits...")
 
-    # Try neighboring cells around goal (3x3 area)
-        for dx in range(-1, 2):
-            for dy in range(-1, 2):
-                new_goal = (goal[0] + dx, goal[1] + dy)
-            # Skip out-of-bound positions
-                if not (0 <= new_goal[0] < warehouse.size and 0 <= new_goal[1] < warehouse.size):
-                    continue
-            # Skip if obstacle
-                if warehouse.grid[new_goal[0], new_goal[1]] == 1:
-                    continue
-            # Try finding path to this new goal
-                alt_path = pathfinder.find_path(start, new_goal)
-                if alt_path:
-                    print(f"✅ Alternate path found to nearby cell {new_goal}")
-                    goal = new_goal
-                    path = alt_path
-                    break
+        # Build all candidate cells in the 3x3 area around the goal at
+        # once, then mask down to in-bounds free cells - A* only runs
+        # on the survivors instead of on all 8 neighbors blindly
+        dys, dxs = np.mgrid[-1:2, -1:2]
+        offsets = np.stack([dys.ravel(), dxs.ravel()], axis=1)
+        offsets = offsets[np.abs(offsets).sum(axis=1) > 0]  # goal itself already failed
+        cands = offsets + goal
+        in_bounds = ((cands[:, 0] >= 0) & (cands[:, 0] < warehouse.size) &
+                     (cands[:, 1] >= 0) & (cands[:, 1] < warehouse.size))
+        cands = cands[in_bounds]
+        cands = cands[warehouse.grid[cands[:, 0], cands[:, 1]] == 0]
+
+        # Try the nearest alternates (Manhattan distance) first
+        order = np.argsort(np.abs(cands - goal).sum(axis=1), kind='stable')
+        for nx, ny in cands[order]:
+            new_goal = (int(nx), int(ny))
+            alt_path = pathfinder.find_path(start, new_goal)
+            if len(alt_path):
+                print(f"✅ Alternate path found to nearby cell {new_goal}")
+                goal = new_goal
+                path = alt_path
+                break
 
     # Still no luck after trying all nearby exits
-    if not path:
+    if len(path) == 0:
         print("⚠️ Even alternate exits are blocked! Try regenerating the warehouse.")
     
     # Print results
     print_results(path, start, goal)
     
     # Visualize
-    if path:
+    if len(path):
         print("📊 Generating visualizations...\n")
         
         visualizer = WarehouseVisualizer(warehouse, path, start, goal)
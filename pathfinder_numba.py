@@ -0,0 +1,145 @@
+import numpy as np
+from numba import njit
+
+# Sentinel for "not yet reached" g-scores
+INT32_MAX = np.iinfo(np.int32).max
+
+
+@njit(cache=True, boundscheck=False)
+def _sift_up(heap_f, heap_idx, pos):
+    """Restore heap order after a push at position `pos` (bubble toward root)"""
+    item_f = heap_f[pos]
+    item_idx = heap_idx[pos]
+    while pos > 0:
+        parent = (pos - 1) >> 1
+        if heap_f[parent] <= item_f:
+            break
+        heap_f[pos] = heap_f[parent]
+        heap_idx[pos] = heap_idx[parent]
+        pos = parent
+    heap_f[pos] = item_f
+    heap_idx[pos] = item_idx
+
+
+@njit(cache=True, boundscheck=False)
+def _sift_down(heap_f, heap_idx, size):
+    """Restore heap order after a pop (root replaced by last element)"""
+    pos = 0
+    item_f = heap_f[0]
+    item_idx = heap_idx[0]
+    child = 1
+    while child < size:
+        right = child + 1
+        if right < size and heap_f[right] < heap_f[child]:
+            child = right
+        if heap_f[child] >= item_f:
+            break
+        heap_f[pos] = heap_f[child]
+        heap_idx[pos] = heap_idx[child]
+        pos = child
+        child = (pos << 1) + 1
+    heap_f[pos] = item_f
+    heap_idx[pos] = item_idx
+
+
+@njit(cache=True, boundscheck=False, fastmath=True)
+def astar(grid, sx, sy, gx, gy):
+    """
+    Array-based A* kernel compiled with Numba
+
+    Works entirely on flat int32 arrays:
+    - coordinates are linearized to idx = x * size + y
+    - the open set is a manual binary min-heap of (f, idx) pairs
+    - stale heap entries are skipped via lazy deletion
+
+    Parameters:
+    - grid: int8 2D array (0 = free, 1 = obstacle)
+    - sx, sy: start coordinates
+    - gx, gy: goal coordinates
+
+    Returns: (found, came_from) where came_from[idx] is the
+             predecessor index of each reached cell (-1 if none)
+    """
+    size = grid.shape[0]
+    n = size * size
+    start_idx = sx * size + sy
+    goal_idx = gx * size + gy
+
+    g = np.full(n, INT32_MAX, np.int32)
+    came_from = np.full(n, -1, np.int32)
+
+    # Each of the 4 edges per cell can push at most once
+    capacity = 4 * n + 1
+    heap_f = np.empty(capacity, np.int32)
+    heap_idx = np.empty(capacity, np.int32)
+    heap_size = 0
+
+    g[start_idx] = 0
+    heap_f[0] = abs(sx - gx) + abs(sy - gy)
+    heap_idx[0] = start_idx
+    heap_size = 1
+
+    while heap_size > 0:
+        # Pop position with lowest f_score
+        cur_f = heap_f[0]
+        cur_idx = heap_idx[0]
+        heap_size -= 1
+        if heap_size > 0:
+            heap_f[0] = heap_f[heap_size]
+            heap_idx[0] = heap_idx[heap_size]
+            _sift_down(heap_f, heap_idx, heap_size)
+
+        x = cur_idx // size
+        y = cur_idx % size
+
+        # Lazy deletion: skip entries superseded by a better push
+        if cur_f > g[cur_idx] + abs(x - gx) + abs(y - gy):
+            continue
+
+        if cur_idx == goal_idx:
+            return True, came_from
+
+        tentative_g = g[cur_idx] + 1
+
+        # Unrolled 4-neighbor expansion (up, down, left, right)
+        for d in range(4):
+            if d == 0:
+                nx = x - 1
+                ny = y
+            elif d == 1:
+                nx = x + 1
+                ny = y
+            elif d == 2:
+                nx = x
+                ny = y - 1
+            else:
+                nx = x
+                ny = y + 1
+
+            if nx < 0 or nx >= size or ny < 0 or ny >= size:
+                continue
+            if grid[nx, ny] != 0:
+                continue
+
+            nidx = nx * size + ny
+            if tentative_g < g[nidx]:
+                g[nidx] = tentative_g
+                came_from[nidx] = cur_idx
+                heap_f[heap_size] = tentative_g + abs(nx - gx) + abs(ny - gy)
+                heap_idx[heap_size] = nidx
+                heap_size += 1
+                _sift_up(heap_f, heap_idx, heap_size - 1)
+
+    # No path found
+    return False, came_from
+
+
+# Warm the JIT at import time: on a 10x10 grid the search itself takes
+# microseconds, but a cold compile takes seconds. This trivial solve
+# either hits the on-disk cache (cache=True) or pays the one-time
+# compile here instead of inside the first real find_path call.
+try:
+    astar(np.zeros((4, 4), np.int8), 0, 0, 3, 3)
+except Exception:
+    # e.g. read-only cache directory; the kernel still compiles lazily
+    pass
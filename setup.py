@@ -0,0 +1,20 @@
+"""
+Build script for the optional _astar C extension
+
+    python setup.py build_ext --inplace
+
+The extension is a secondary fast path: AStarPathfinder prefers it
+when built, falls back to the Numba kernel, and finally to pure
+Python, so the simulator runs fine without compiling anything.
+"""
+from setuptools import setup, Extension
+
+import numpy
+
+setup(
+    name='smartware-robot',
+    ext_modules=[
+        Extension('_astar', sources=['_astar.c'],
+                  include_dirs=[numpy.get_include()]),
+    ],
+)
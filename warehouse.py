@@ -8,16 +8,29 @@ class WarehouseGrid:
     - Provides grid state management
     """
     
-    def __init__(self, size=10, obstacle_density=0.20):
+    def __init__(self, size=10, obstacle_density=0.20, seed=None):
         """
         Initialize warehouse grid
-        
+
         Parameters:
         - size: Grid dimensions (size x size)
         - obstacle_density: Percentage of cells that are obstacles (0.0 to 1.0)
+        - seed: Optional RNG seed for reproducible layouts (benchmarking)
         """
         self.size = size
-        self.grid = np.zeros((size, size), dtype=int)  #grid with zeros generation
+        # Cached Generator: faster per call than the legacy global
+        # np.random.* functions, and seedable for stable benchmarks
+        self._rng = np.random.default_rng(seed)
+        # Grid padded with a 1-cell obstacle border: out-of-bounds
+        # probes read the border, so pathfinding can skip bounds
+        # checks. self.grid is the interior view sharing its memory,
+        # so obstacle edits keep the padded copy in sync for free.
+        # int8 cells (1 byte vs 8 for the default int64): the whole
+        # obstacle array stays L1-resident for much larger grids,
+        # cutting cache misses in the randomly-indexing A* hot loop
+        self._padded = np.ones((size + 2, size + 2), dtype=np.int8)
+        self._padded[1:-1, 1:-1] = 0  #grid with zeros generation
+        self.grid = self._padded[1:-1, 1:-1]
         self.obstacle_density = obstacle_density
         self._generate_obstacles()
         self.grid[0, 0] = 0
@@ -28,27 +41,43 @@ class WarehouseGrid:
         """
         Randomly place obstacles in the warehouse
         Creates clusters to simulate realistic warehouse layout (shelving units)
+
+        Fully vectorized: seed cells are drawn in one sampling pass and
+        clusters grow by dilating a random subset of seeds with shifted
+        array ORs, instead of placing cells one by one in a Python loop
         """
         num_obstacles = int(self.size * self.size * self.obstacle_density)
-        placed = 0
-        
-        while placed < num_obstacles:
-            x = np.random.randint(0, self.size)
-            y = np.random.randint(0, self.size)
-            
-            if self.grid[x, y] == 0:  
-                self.grid[x, y] = 1
-                placed += 1           #obstacle generation
-                
-                # Add neighboring obstacles to create clusters (realistic shelving)
-                if placed < num_obstacles and np.random.random() > 0.5:
-                    neighbors = [(x+1, y), (x-1, y), (x, y+1), (x, y-1)]
-                    for nx, ny in neighbors:
-                        if (0 <= nx < self.size and 0 <= ny < self.size and 
-                            self.grid[nx, ny] == 0 and placed < num_obstacles):
-                            if np.random.random() > 0.5:
-                                self.grid[nx, ny] = 1
-                                placed += 1
+        if num_obstacles == 0:
+            return
+
+        # Seed roughly half the budget at once; dilation fills the rest
+        num_seeds = max(1, num_obstacles // 2)
+        seeds = self._rng.choice(self.size * self.size, size=num_seeds,
+                                 replace=False)
+        mask = np.zeros((self.size, self.size), dtype=bool)
+        mask.flat[seeds] = True
+
+        # Grow clusters: dilate a random ~50% subset of seeds with a
+        # cross-shaped element (the four shifted ORs)
+        grow = mask & (self._rng.random(mask.shape) > 0.5)
+        mask[1:, :] |= grow[:-1, :]
+        mask[:-1, :] |= grow[1:, :]
+        mask[:, 1:] |= grow[:, :-1]
+        mask[:, :-1] |= grow[:, 1:]
+
+        # Trim or top up to hit the exact obstacle budget
+        count = int(mask.sum())
+        flat = mask.ravel()
+        if count > num_obstacles:
+            drop = self._rng.choice(np.flatnonzero(flat),
+                                    size=count - num_obstacles, replace=False)
+            flat[drop] = False
+        elif count < num_obstacles:
+            add = self._rng.choice(np.flatnonzero(~flat),
+                                   size=num_obstacles - count, replace=False)
+            flat[add] = True
+
+        self.grid[mask] = 1
     
     def is_valid_position(self, x, y):
         """robot doesnt move outside of grid"""